@@ -6,81 +6,24 @@ It creates 10,000 rows of realistic creator performance data with logical
 correlations between features, a calculated project success score, and a project price.
 """
 
+from multiprocessing.pool import ThreadPool
+
 import pandas as pd
 import numpy as np
-from faker import Faker
-
-# Initialize random seed for reproducibility
-np.random.seed(42)
-fake = Faker()
-Faker.seed(42)
+from numba import njit
+import pyarrow as pa
+from pyarrow import csv as pacsv
 
 # Define the number of rows to generate
 NUM_ROWS = 10000
 
-print(f"Generating {NUM_ROWS} rows of synthetic creator data...")
-
-# ============================================================================
-# STEP 1: Generate base features with realistic distributions
-# ============================================================================
-
-# Generate tenure_months (6-60 months)
-tenure_months = np.random.randint(6, 61, NUM_ROWS)
-
-# Generate projects_completed - positively correlated with tenure
-# Base projects on tenure, with some randomness
-base_projects = (tenure_months / 60) * 45 + 5  # Scale with tenure
-projects_completed = np.clip(
-    base_projects + np.random.normal(0, 5, NUM_ROWS),  # Add noise
-    5, 50
-).astype(int)
-
-# Generate portfolio_strength (0.5-1.0)
-portfolio_strength = np.random.uniform(0.5, 1.0, NUM_ROWS)
-
-# ============================================================================
-# STEP 2: Generate correlated features
-# ============================================================================
-
-# Generate on_time_delivery_percent (0.7-1.0)
-# Slightly influenced by portfolio strength
-base_delivery = np.random.uniform(0.7, 1.0, NUM_ROWS)
-on_time_delivery_percent = np.clip(
-    base_delivery + (portfolio_strength - 0.75) * 0.1,
-    0.7, 1.0
-)
-
-# Generate avg_client_rating (3.5-5.0) - positively correlated with on_time_delivery
-# Strong correlation: better delivery = higher ratings
-base_rating = 3.5 + (on_time_delivery_percent - 0.7) / 0.3 * 1.3  # Scale delivery to rating range
-avg_client_rating = np.clip(
-    base_rating + np.random.normal(0, 0.15, NUM_ROWS),  # Add small noise
-    3.5, 5.0
-)
-
-# Generate dispute_rate (0.0-0.15) - negatively correlated with avg_client_rating
-# Higher ratings = lower disputes
-base_dispute = 0.15 - ((avg_client_rating - 3.5) / 1.5) * 0.12  # Inverse relationship
-dispute_rate = np.clip(
-    base_dispute + np.random.uniform(-0.02, 0.02, NUM_ROWS),  # Add noise
-    0.0, 0.15
-)
-
-# Generate rating_trajectory (-0.2 to 0.3)
-# Slightly influenced by current rating (room for improvement if low)
-rating_trajectory = np.where(
-    avg_client_rating < 4.2,
-    np.random.uniform(0.0, 0.3, NUM_ROWS),  # Lower ratings -> positive trajectory
-    np.random.uniform(-0.2, 0.2, NUM_ROWS)   # Higher ratings -> mixed trajectory
-)
+# Number of worker threads. NumPy's Generator and the Numba kernel release the
+# GIL, so row-range chunks can be filled concurrently from independent RNG streams.
+# Kept fixed (not os.cpu_count()) so the dataset is identical on every machine.
+N_THREADS = 8
 
-# Generate project_category (categorical feature)
-categories = ['UI/UX Design', 'Web Development', 'Mobile Development', 'Graphic Design']
-project_category = np.random.choice(categories, NUM_ROWS)
-
-# ============================================================================
-# STEP 3: Calculate target variable - project_success_score (0-100)
-# ============================================================================
+# Project categories (categorical feature)
+categories = np.array(['UI/UX Design', 'Web Development', 'Mobile Development', 'Graphic Design'])
 
 # Define weights for each feature (must sum to 1.0)
 WEIGHT_ON_TIME = 0.30        # 30% - Most important
@@ -90,71 +33,229 @@ WEIGHT_TRAJECTORY = 0.12     # 12% - Good indicator
 WEIGHT_PROJECTS = 0.10       # 10% - Experience matters
 WEIGHT_DISPUTE = 0.08        # 8% - Negative indicator
 
-# Normalize features to 0-1 scale for weighted calculation
-norm_on_time = (on_time_delivery_percent - 0.7) / 0.3
-norm_rating = (avg_client_rating - 3.5) / 1.5
-norm_portfolio = (portfolio_strength - 0.5) / 0.5
-norm_trajectory = (rating_trajectory + 0.2) / 0.5
-norm_projects = (projects_completed - 5) / 45
-norm_dispute = 1 - (dispute_rate / 0.15)  # Inverse (lower is better)
-
-# Calculate weighted score
-project_success_score = (
-    WEIGHT_ON_TIME * norm_on_time +
-    WEIGHT_RATING * norm_rating +
-    WEIGHT_PORTFOLIO * norm_portfolio +
-    WEIGHT_TRAJECTORY * norm_trajectory +
-    WEIGHT_PROJECTS * norm_projects +
-    WEIGHT_DISPUTE * norm_dispute
-) * 100  # Scale to 0-100
-
-# Add realistic noise to simulate real-world variance
-noise = np.random.normal(0, 3, NUM_ROWS)  # Mean=0, StdDev=3
-project_success_score = np.clip(project_success_score + noise, 0, 100)
-
-# ============================================================================
-# STEP 4: Calculate project_price_inr (Pricing Co-Pilot Target)
-# ============================================================================
-
-print("\nCalculating project prices based on creator metrics...")
-
-# Calculate base price from key metrics (already normalized 0-1)
-# Weight experience, portfolio, and rating for pricing
-price_factor = (norm_projects * 0.4) + (norm_portfolio * 0.3) + (norm_rating * 0.3)
-
-# Scale to a realistic INR range (50,000 to 5,00,000)
-base_price = 50000 + (price_factor * 450000)
-
-# Add realistic noise to simulate market variance
-project_price_inr = np.clip(
-    base_price + np.random.normal(0, 15000, NUM_ROWS),
-    50000,
-    500000
-).astype(int)
+print(f"Generating {NUM_ROWS} rows of synthetic creator data...")
 
+# Pre-allocate every output column; each thread fills its own row range.
+# Features only keep 2-3 decimals in the CSV, so float32 is plenty and halves
+# the memory traffic of every pass below.
+tenure_months = np.empty(NUM_ROWS, dtype=np.int16)
+projects_completed = np.empty(NUM_ROWS, dtype=np.int16)
+portfolio_strength = np.empty(NUM_ROWS, dtype=np.float32)
+on_time_delivery_percent = np.empty(NUM_ROWS, dtype=np.float32)
+avg_client_rating = np.empty(NUM_ROWS, dtype=np.float32)
+dispute_rate = np.empty(NUM_ROWS, dtype=np.float32)
+rating_trajectory = np.empty(NUM_ROWS, dtype=np.float32)
+# project_category holds int8 indices into `categories`; strings are only
+# materialized by the CSV writer
+project_category = np.empty(NUM_ROWS, dtype=np.int8)
+project_success_score = np.empty(NUM_ROWS, dtype=np.float32)
+project_price_inr = np.empty(NUM_ROWS, dtype=np.int32)
+
+
+@njit(nogil=True, cache=True)
+def derive_features(tenure, normal_draws, uniform_draws,
+                    projects_out, portfolio_out, on_time_out, rating_out,
+                    dispute_out, trajectory_out, score_out, price_out):
+    """
+    Compute every derived column for one chunk in a single pass over its rows.
+
+    All intermediates for a row stay in registers; only the final values are
+    written to the output slices. nogil lets the ThreadPool run chunks in parallel.
+    """
+    for i in range(tenure.shape[0]):
+        # --------------------------------------------------------------------
+        # STEP 1: Generate base features with realistic distributions
+        # --------------------------------------------------------------------
+
+        # Generate projects_completed - positively correlated with tenure
+        # Base projects on tenure, with some randomness
+        base_projects = tenure[i] * (45 / 60) + 5  # Scale with tenure
+        projects = int(min(max(base_projects + normal_draws[i, 0] * 5, 5.0), 50.0))
+
+        # Generate portfolio_strength (0.5-1.0)
+        portfolio = 0.5 + uniform_draws[i, 0] * 0.5
+
+        # --------------------------------------------------------------------
+        # STEP 2: Generate correlated features
+        # --------------------------------------------------------------------
+
+        # Generate on_time_delivery_percent (0.7-1.0)
+        # Slightly influenced by portfolio strength
+        base_delivery = 0.7 + uniform_draws[i, 1] * 0.3
+        on_time = min(max(base_delivery + (portfolio - 0.75) * 0.1, 0.7), 1.0)
+
+        # Generate avg_client_rating (3.5-5.0) - positively correlated with on_time_delivery
+        # Strong correlation: better delivery = higher ratings
+        base_rating = 3.5 + (on_time - 0.7) / 0.3 * 1.3  # Scale delivery to rating range
+        rating = min(max(base_rating + normal_draws[i, 1] * 0.15, 3.5), 5.0)
+
+        # Generate dispute_rate (0.0-0.15) - negatively correlated with avg_client_rating
+        # Higher ratings = lower disputes
+        base_dispute = 0.15 - ((rating - 3.5) / 1.5) * 0.12  # Inverse relationship
+        dispute = min(max(base_dispute + (uniform_draws[i, 2] * 0.04 - 0.02), 0.0), 0.15)
+
+        # Generate rating_trajectory (-0.2 to 0.3)
+        # Slightly influenced by current rating (room for improvement if low)
+        # Lower ratings -> positive trajectory in [0.0, 0.3)
+        # Higher ratings -> mixed trajectory in [-0.2, 0.2)
+        # The one uniform draw is scaled using the comparison as 0/1, so there
+        # is no data-dependent branch
+        low_rating = 1.0 if rating < 4.2 else 0.0
+        trajectory = uniform_draws[i, 3] * (0.4 - 0.1 * low_rating) + 0.2 * low_rating - 0.2
+
+        # --------------------------------------------------------------------
+        # STEP 3: Calculate target variable - project_success_score (0-100)
+        # --------------------------------------------------------------------
+
+        # Normalize features to 0-1 scale for weighted calculation
+        norm_on_time = (on_time - 0.7) / 0.3
+        norm_rating = (rating - 3.5) / 1.5
+        norm_portfolio = (portfolio - 0.5) / 0.5
+        norm_trajectory = (trajectory + 0.2) / 0.5
+        norm_projects = (projects - 5) / 45
+        norm_dispute = 1 - (dispute / 0.15)  # Inverse (lower is better)
+
+        # Calculate weighted score, scaled to 0-100, with realistic noise to
+        # simulate real-world variance (StdDev=3)
+        score = (
+            WEIGHT_ON_TIME * norm_on_time +
+            WEIGHT_RATING * norm_rating +
+            WEIGHT_PORTFOLIO * norm_portfolio +
+            WEIGHT_TRAJECTORY * norm_trajectory +
+            WEIGHT_PROJECTS * norm_projects +
+            WEIGHT_DISPUTE * norm_dispute
+        ) * 100
+        score = min(max(score + normal_draws[i, 2] * 3, 0.0), 100.0)
+
+        # --------------------------------------------------------------------
+        # STEP 4: Calculate project_price_inr (Pricing Co-Pilot Target)
+        # --------------------------------------------------------------------
+
+        # Calculate base price factor from key metrics (already normalized 0-1)
+        # Weight experience, portfolio, and rating for pricing
+        price_factor = (norm_projects * 0.4) + (norm_portfolio * 0.3) + (norm_rating * 0.3)
+
+        # Scale to a realistic INR range (50,000 to 5,00,000) and add realistic
+        # noise to simulate market variance
+        base_price = 50000 + (price_factor * 450000)
+        price = min(max(base_price + normal_draws[i, 3] * 15000, 50000.0), 500000.0)
+
+        projects_out[i] = projects
+        portfolio_out[i] = portfolio
+        on_time_out[i] = on_time
+        rating_out[i] = rating
+        dispute_out[i] = dispute
+        trajectory_out[i] = trajectory
+        score_out[i] = score
+        price_out[i] = int(price)
+
+
+def generate_chunk(start, stop, seed):
+    """
+    Fill rows [start, stop) of every output column from an independent RNG stream.
+    """
+    n = stop - start
+    rng = np.random.default_rng(seed)
+
+    # Draw all random noise up front in two batched calls instead of one call per
+    # feature; derive_features reads the columns it needs per row.
+    # Normal slots: [projects noise, rating noise, score noise, price noise]
+    # Uniform slots: [portfolio, delivery, dispute noise, trajectory]
+    normal_draws = rng.standard_normal((n, 4), dtype=np.float32)
+    uniform_draws = rng.random((n, 4), dtype=np.float32)
+
+    # Generate tenure_months (6-60 months)
+    tenure_months[start:stop] = rng.integers(6, 61, n, dtype=np.int16)
+
+    # Generate project_category (categorical feature) as integer codes
+    project_category[start:stop] = rng.integers(0, len(categories), n, dtype=np.int8)
+
+    # Compute all correlated features and targets directly into the shared
+    # output columns
+    derive_features(
+        tenure_months[start:stop], normal_draws, uniform_draws,
+        projects_completed[start:stop],
+        portfolio_strength[start:stop],
+        on_time_delivery_percent[start:stop],
+        avg_client_rating[start:stop],
+        dispute_rate[start:stop],
+        rating_trajectory[start:stop],
+        project_success_score[start:stop],
+        project_price_inr[start:stop]
+    )
+
+
+# Split rows into one contiguous range per thread, each with its own child seed
+child_seeds = np.random.SeedSequence(42).spawn(N_THREADS)
+bounds = np.linspace(0, NUM_ROWS, N_THREADS + 1).astype(int)
+
+with ThreadPool(N_THREADS) as pool:
+    pool.starmap(
+        generate_chunk,
+        [(bounds[i], bounds[i + 1], child_seeds[i]) for i in range(N_THREADS)]
+    )
+
+print(f"✓ Generated {N_THREADS} row chunks in parallel")
 print(f"✓ Price range generated: ₹{project_price_inr.min():,} to ₹{project_price_inr.max():,}")
 
 # ============================================================================
 # STEP 5: Create DataFrame and save to CSV
 # ============================================================================
 
-# Create the DataFrame with all columns
-df = pd.DataFrame({
+columns = {
     'projects_completed': projects_completed,
     'tenure_months': tenure_months,
-    'portfolio_strength': np.round(portfolio_strength, 2),
-    'on_time_delivery_percent': np.round(on_time_delivery_percent, 2),
-    'avg_client_rating': np.round(avg_client_rating, 2),
-    'rating_trajectory': np.round(rating_trajectory, 2),
-    'dispute_rate': np.round(dispute_rate, 3),
-    'project_category': project_category,
-    'project_success_score': np.round(project_success_score, 2),
+    'portfolio_strength': portfolio_strength,
+    'on_time_delivery_percent': on_time_delivery_percent,
+    'avg_client_rating': avg_client_rating,
+    'rating_trajectory': rating_trajectory,
+    'dispute_rate': dispute_rate,
+    'project_category': pa.DictionaryArray.from_arrays(project_category, categories),
+    'project_success_score': project_success_score,
     'project_price_inr': project_price_inr
-})
-
-# Save to CSV
+}
+
+# Precision kept in the dataset for each float column
+column_decimals = {
+    'portfolio_strength': 2,
+    'on_time_delivery_percent': 2,
+    'avg_client_rating': 2,
+    'rating_trajectory': 2,
+    'dispute_rate': 3,
+    'project_success_score': 2,
+}
+
+# Round the float32 columns in place for the CSV
+for name, decimals in column_decimals.items():
+    np.round(columns[name], decimals, out=columns[name])
+
+# Save to CSV with pyarrow's C++ writer straight from the NumPy arrays,
+# avoiding pandas' per-cell Python formatting. pyarrow always quotes the header
+# and (with quoting_style="needed") every string cell, so the header is written
+# here and quoting is turned off to keep the unquoted DataFrame.to_csv format;
+# no column name or category contains a comma or quote.
 output_file = 'creator_data.csv'
-df.to_csv(output_file, index=False)
+table = pa.table(columns)
+with open(output_file, 'wb') as csv_file:
+    csv_file.write((','.join(table.column_names) + '\n').encode())
+    pacsv.write_csv(
+        table,
+        csv_file,
+        write_options=pacsv.WriteOptions(include_header=False, quoting_style="none")
+    )
+
+# Keep a DataFrame only for the summary statistics below. The float columns are
+# re-rounded in float64 so the printout shows the values written to the CSV
+# (45.15, not 45.150002). The category codes are wrapped as a pd.Categorical
+# rather than expanded to string objects.
+df = pd.DataFrame({
+    **columns,
+    **{
+        name: np.round(columns[name].astype(np.float64), decimals)
+        for name, decimals in column_decimals.items()
+    },
+    'project_category': pd.Categorical.from_codes(project_category, categories=categories)
+})
 
 print(f"\n✓ Successfully generated {NUM_ROWS} rows of data")
 print(f"✓ Saved to: {output_file}")
@@ -171,12 +272,29 @@ print(df.describe())
 print("\n" + "="*70)
 print("KEY CORRELATIONS")
 print("="*70)
-print(f"projects_completed vs tenure_months: {df['projects_completed'].corr(df['tenure_months']):.3f}")
-print(f"avg_client_rating vs on_time_delivery_percent: {df['avg_client_rating'].corr(df['on_time_delivery_percent']):.3f}")
-print(f"dispute_rate vs avg_client_rating: {df['dispute_rate'].corr(df['avg_client_rating']):.3f}")
-print(f"project_success_score vs avg_client_rating: {df['project_success_score'].corr(df['avg_client_rating']):.3f}")
-print(f"project_price_inr vs projects_completed: {df['project_price_inr'].corr(df['projects_completed']):.3f}")
-print(f"project_price_inr vs avg_client_rating: {df['project_price_inr'].corr(df['avg_client_rating']):.3f}")
+
+# Pairs of columns whose correlation is reported
+correlation_pairs = [
+    ('projects_completed', 'tenure_months'),
+    ('avg_client_rating', 'on_time_delivery_percent'),
+    ('dispute_rate', 'avg_client_rating'),
+    ('project_success_score', 'avg_client_rating'),
+    ('project_price_inr', 'projects_completed'),
+    ('project_price_inr', 'avg_client_rating'),
+]
+
+# Compute the full correlation matrix of the involved columns in one
+# np.corrcoef pass instead of one pandas Series.corr call per pair
+correlation_columns = sorted({name for pair in correlation_pairs for name in pair})
+correlation_index = {name: i for i, name in enumerate(correlation_columns)}
+correlation_matrix = np.corrcoef(
+    np.column_stack([columns[name] for name in correlation_columns]),
+    rowvar=False
+)
+
+for first, second in correlation_pairs:
+    correlation = correlation_matrix[correlation_index[first], correlation_index[second]]
+    print(f"{first} vs {second}: {correlation:.3f}")
 
 print("\n" + "="*70)
 print("SAMPLE DATA (first 5 rows)")
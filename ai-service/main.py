@@ -12,23 +12,56 @@ prediction, and explainability features.
 # ============================================================================
 
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
-import joblib
-import pandas as pd
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+import asyncio
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
 import numpy as np
-import shap
+import orjson
+from numba import njit
+import onnxruntime as ort
 import uvicorn
 import xgboost as xgb
-from typing import List, Dict
+from typing import Any, AsyncIterator, Callable, List, Dict, Optional, Sequence, Set, Tuple
 
 # ============================================================================
-# STEP 2: Define Pydantic Input Schema for Data Validation
+# STEP 2: Configure Logging
+# ============================================================================
+
+# Handlers only put records on an in-memory queue; a QueueListener thread does
+# the formatting and stdout writes, so request handlers never block on a slow
+# pipe. Per-request lines are logged at DEBUG and skipped at the default INFO
+# level; set LOG_LEVEL=DEBUG to see them.
+logger: logging.Logger = logging.getLogger("verifund.api")
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+logger.propagate = False
+
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+log_listener: logging.handlers.QueueListener = logging.handlers.QueueListener(
+    log_queue, logging.StreamHandler(sys.stdout)
+)
+log_listener.start()
+atexit.register(log_listener.stop)  # Flush queued records on exit
+
+# ============================================================================
+# STEP 3: Define Pydantic Input Schema for Data Validation
 # ============================================================================
 
 class CreatorData(BaseModel):
     """
     Pydantic model for validating incoming creator data requests.
     Ensures all required fields are present and have correct data types.
+    Unknown fields are rejected with a 422 response (pydantic's default is to
+    silently ignore them).
     """
     projects_completed: int = Field(..., ge=5, le=50, description="Number of projects completed (5-50)")
     tenure_months: int = Field(..., ge=6, le=60, description="Tenure in months (6-60)")
@@ -39,8 +72,9 @@ class CreatorData(BaseModel):
     dispute_rate: float = Field(..., ge=0.0, le=0.15, description="Dispute rate (0.0-0.15)")
     project_category: str = Field(..., description="Project category (e.g., 'UI/UX Design')")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra='forbid',
+        json_schema_extra={
             "example": {
                 "projects_completed": 25,
                 "tenure_months": 36,
@@ -52,29 +86,54 @@ class CreatorData(BaseModel):
                 "project_category": "Web Development"
             }
         }
+    )
 
 # ============================================================================
-# STEP 3: Load Models and Define Training Columns on Startup
+# STEP 4: Load Models and Define Training Columns on Startup
 # ============================================================================
 
-print("="*80)
-print("VeriFund API - Initializing...")
-print("="*80)
+logger.info("="*80)
+logger.info("VeriFund API - Initializing...")
+logger.info("="*80)
+
+def load_onnx_session(model_file: str) -> ort.InferenceSession:
+    """
+    Load an ONNX model into an ONNX Runtime session with all graph optimizations.
+    
+    Each run uses a single intra-op thread; concurrency comes from the prediction
+    thread pool running several batches at once.
+    """
+    options: ort.SessionOptions = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.intra_op_num_threads = 1
+    return ort.InferenceSession(model_file, options, providers=['CPUExecutionProvider'])
+
+# Load the success score model into ONNX Runtime for predictions. Its fused C++
+# tree-ensemble kernel has far less per-call overhead than XGBoost's predictor.
+try:
+    score_session: ort.InferenceSession = load_onnx_session('verifund_model.onnx')
+    logger.info("✓ Success score model loaded successfully from 'verifund_model.onnx'")
+except Exception as e:
+    logger.error(f"✗ Error loading success score model: {e}")
+    raise
 
-# Load the pre-trained XGBoost success score model
+# Load the native XGBoost booster of the success score model, which is still
+# needed to compute SHAP contributions (ONNX Runtime cannot produce them).
+# Loading the Booster directly skips unpickling the sklearn wrapper, which each
+# uvicorn worker process would otherwise pay at import time.
 try:
-    model: xgb.XGBRegressor = joblib.load('verifund_model.joblib')
-    print("✓ Success score model loaded successfully from 'verifund_model.joblib'")
+    booster: xgb.Booster = xgb.Booster(model_file='verifund_model.ubj')
+    logger.info("✓ Success score explainer loaded successfully from 'verifund_model.ubj'")
 except Exception as e:
-    print(f"✗ Error loading success score model: {e}")
+    logger.error(f"✗ Error loading success score booster: {e}")
     raise
 
-# Load the pre-trained XGBoost pricing model
+# Load the pre-trained pricing model into ONNX Runtime
 try:
-    price_model: xgb.XGBRegressor = joblib.load('price_model.joblib')
-    print("✓ Pricing model loaded successfully from 'price_model.joblib'")
+    price_session: ort.InferenceSession = load_onnx_session('price_model.onnx')
+    logger.info("✓ Pricing model loaded successfully from 'price_model.onnx'")
 except Exception as e:
-    print(f"✗ Error loading pricing model: {e}")
+    logger.error(f"✗ Error loading pricing model: {e}")
     raise
 
 # Define the exact column names the model was trained on (after one-hot encoding)
@@ -93,34 +152,352 @@ TRAINING_COLUMNS: List[str] = [
     'project_category_Web Development'
 ]
 
-print(f"✓ Training columns defined: {len(TRAINING_COLUMNS)} features")
+# Numeric CreatorData attributes, which occupy the leading TRAINING_COLUMNS slots in order
+FEATURE_ATTRS: Tuple[str, ...] = tuple(
+    col for col in TRAINING_COLUMNS if not col.startswith('project_category_')
+)
+
+# Map each known project category to the index of its one-hot column, so requests
+# can be encoded without pd.get_dummies + reindex
+CATEGORY_INDEX: Dict[str, int] = {
+    col.replace('project_category_', ''): idx
+    for idx, col in enumerate(TRAINING_COLUMNS)
+    if col.startswith('project_category_')
+}
+
+# Pre-built one-hot rows for every known category. A request copies its
+# category's template and only fills in the numeric slots. Categories the model
+# was not trained on (e.g. the backend's project categories) encode as all zeros.
+CATEGORY_TEMPLATES: Dict[str, np.ndarray] = {}
+for category, category_idx in CATEGORY_INDEX.items():
+    template: np.ndarray = np.zeros((1, len(TRAINING_COLUMNS)), dtype=np.float32)
+    template[0, category_idx] = 1.0
+    CATEGORY_TEMPLATES[category] = template
+UNKNOWN_CATEGORY_TEMPLATE: np.ndarray = np.zeros((1, len(TRAINING_COLUMNS)), dtype=np.float32)
+
+# Number of SHAP reasons returned by /score, and a mask of the one-hot category
+# columns used when selecting them
+TOP_REASONS: int = 5
+IS_CATEGORY_COLUMN: np.ndarray = np.array(
+    [col.startswith('project_category_') for col in TRAINING_COLUMNS]
+)
+
+# /suggest-price range: ±12% around the suggestion, kept within realistic
+# bounds (50k to 500k INR)
+PRICE_LOW_MULTIPLIER: float = 0.88
+PRICE_HIGH_MULTIPLIER: float = 1.12
+MIN_PRICE_INR: int = 50000
+MAX_PRICE_INR: int = 500000
+
+logger.info(f"✓ Training columns defined: {len(TRAINING_COLUMNS)} features")
+
+# Run one dummy prediction through every inference path so XGBoost and ONNX
+# Runtime set up their predictor state at startup instead of on the first real
+# request. Inference is pinned to one thread per call: requests are
+# micro-batched, and for a handful of rows thread synchronization costs more
+# than it saves.
+warmup_row: np.ndarray = np.zeros((1, len(TRAINING_COLUMNS)), dtype=np.float32)
+booster.set_param({'nthread': 1})
+booster.predict(xgb.DMatrix(warmup_row, feature_names=TRAINING_COLUMNS), pred_contribs=True)
+for warm_session in (score_session, price_session):
+    warm_session.run(None, {warm_session.get_inputs()[0].name: warmup_row})
 
-# Initialize SHAP explainer once at startup for efficiency
+logger.info("✓ Predictors warmed up")
+
+logger.info("="*80)
+logger.info("✓ API initialization complete")
+logger.info("="*80 + "\n")
+
+# ============================================================================
+# STEP 5: Define Feature Encoding and Reason Selection Helpers
+# ============================================================================
+
+def build_feature_vector(creator: CreatorData) -> np.ndarray:
+    """
+    Encode a creator into a single float32 row matching TRAINING_COLUMNS.
+    
+    The row starts as a copy of the category's cached one-hot template and the
+    numeric fields are read straight off the Pydantic instance, with no
+    intermediate dict or DataFrame. An unknown category leaves every category
+    column at 0.
+    
+    Args:
+        creator (CreatorData): Creator's performance data
+        
+    Returns:
+        np.ndarray: Array of shape (1, len(TRAINING_COLUMNS))
+    """
+    x: np.ndarray = CATEGORY_TEMPLATES.get(
+        creator.project_category, UNKNOWN_CATEGORY_TEMPLATE
+    ).copy()
+    
+    for idx, attr in enumerate(FEATURE_ATTRS):
+        x[0, idx] = getattr(creator, attr)
+    
+    return x
+
+
+@njit(nogil=True, cache=True)
+def select_top_reasons(
+    rows: np.ndarray,
+    shap_values: np.ndarray,
+    is_category: np.ndarray,
+    k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pick the k most impactful eligible features of every row in a batch.
+    
+    A numeric feature is eligible if its value is non-zero or its SHAP impact
+    exceeds 0.01; a one-hot category column only if it is the active category.
+    Features are ranked by absolute impact rounded to the reported 2 decimals,
+    with ties going to the earlier column. Each row is a single compiled pass
+    with an insertion-sorted top-k buffer, so the handler only builds the k
+    reason dicts.
+    
+    Args:
+        rows (np.ndarray): Encoded feature rows, shape (n_rows, n_features)
+        shap_values (np.ndarray): SHAP contributions, shape (n_rows, n_features),
+            optionally followed by a bias column, which is ignored
+        is_category (np.ndarray): Boolean mask of the one-hot category columns
+        k (int): Maximum number of features to select per row
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Selected feature indices per row, shape
+        (n_rows, k) and ordered by descending rank, and the number selected per row
+    """
+    n_rows, n_features = rows.shape
+    top_idx: np.ndarray = np.empty((n_rows, k), dtype=np.int64)
+    counts: np.ndarray = np.zeros(n_rows, dtype=np.int64)
+    top_keys: np.ndarray = np.empty(k, dtype=np.int64)
+    
+    for row in range(n_rows):
+        count = 0
+        for idx in range(n_features):
+            impact = abs(shap_values[row, idx])
+            if is_category[idx]:
+                eligible = rows[row, idx] == 1
+            else:
+                eligible = rows[row, idx] != 0 or impact > 0.01
+            if not eligible:
+                continue
+            
+            # Encode the rounded impact and the column position in one integer
+            # key so ordering is exact and ties favour the earlier column. The
+            # product is taken in float64, where float32 * 100 is exact, so the
+            # key rounds the same way as the reported round(float(v), 2)
+            key = np.int64(np.rint(np.float64(impact) * 100)) * n_features - idx
+            if count == k and key <= top_keys[k - 1]:
+                continue
+            
+            # Shift lower-ranked entries down and insert, dropping the k-th if full
+            pos = min(count, k - 1)
+            while pos > 0 and top_keys[pos - 1] < key:
+                top_keys[pos] = top_keys[pos - 1]
+                top_idx[row, pos] = top_idx[row, pos - 1]
+                pos -= 1
+            top_keys[pos] = key
+            top_idx[row, pos] = idx
+            if count < k:
+                count += 1
+        counts[row] = count
+    
+    return top_idx, counts
+
+# ============================================================================
+# STEP 6: Define Micro-Batching Prediction Queue
+# ============================================================================
+
+class PredictionBatcher:
+    """
+    Collects single-row predictions from concurrent requests into one batch.
+    
+    Each request enqueues its feature row and awaits a future. A background task
+    takes the first waiting row, gives other requests max_wait seconds to join,
+    stacks up to max_batch_size rows into one array, and resolves every future
+    from a single predict_fn call. The models' per-call overhead is then paid once
+    per batch instead of once per request.
+    
+    predict_fn runs on a bounded thread pool, so the event loop keeps accepting
+    requests (and collecting the next batch) while a model is busy.
+    """
+    
+    def __init__(
+        self,
+        predict_fn: Callable[[np.ndarray], Sequence[Any]],
+        executor: ThreadPoolExecutor,
+        max_batch_size: int = 64,
+        max_wait: float = 0.002
+    ) -> None:
+        self.predict_fn = predict_fn
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        # Created in start() so they bind to the server's running event loop
+        self.queue: Optional[asyncio.Queue] = None
+        self.task: Optional[asyncio.Task] = None
+        # Batches currently being predicted, referenced until they finish
+        self.in_flight: Set[asyncio.Task] = set()
+    
+    def start(self) -> None:
+        """Start the background batching task on the running event loop."""
+        self.queue = asyncio.Queue()
+        self.task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Cancel the background batching task and wait for in-flight batches."""
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+        if self.in_flight:
+            await asyncio.gather(*self.in_flight, return_exceptions=True)
+    
+    async def predict(self, x: np.ndarray) -> Any:
+        """
+        Queue a (1, n_features) row and wait for its prediction.
+        
+        Args:
+            x (np.ndarray): Encoded feature row from build_feature_vector
+            
+        Returns:
+            Any: The predict_fn result for this row
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self.queue.put((x, future))
+        return await future
+    
+    async def _run(self) -> None:
+        while True:
+            batch: List[Tuple[np.ndarray, asyncio.Future]] = [await self.queue.get()]
+            
+            # Give concurrent requests a short window to join this batch
+            await asyncio.sleep(self.max_wait)
+            while len(batch) < self.max_batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            
+            # Predict in the background so the next batch can start collecting
+            batch_task: asyncio.Task = asyncio.create_task(self._predict_batch(batch))
+            self.in_flight.add(batch_task)
+            batch_task.add_done_callback(self.in_flight.discard)
+    
+    async def _predict_batch(self, batch: List[Tuple[np.ndarray, asyncio.Future]]) -> None:
+        try:
+            rows: np.ndarray = np.vstack([x for x, _ in batch])
+            results: Sequence[Any] = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.predict_fn, rows
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+def predict_scores(rows: np.ndarray) -> List[Tuple[float, np.ndarray, np.ndarray]]:
+    """
+    Predict success scores, SHAP contributions and top reasons for a batch of encoded rows.
+    
+    Returns:
+        List[Tuple[float, np.ndarray, np.ndarray]]: (score, per-feature SHAP
+        values, indices of the top reasons) per row
+    """
+    scores: np.ndarray = score_session.run(None, {score_session.get_inputs()[0].name: rows})[0].ravel()
+    
+    # Calculate exact TreeSHAP values natively in XGBoost's C++ predictor.
+    # Each row holds one value per feature followed by the bias, which the
+    # reason selector ignores and the returned rows drop.
+    contribs: np.ndarray = booster.predict(
+        xgb.DMatrix(rows, feature_names=TRAINING_COLUMNS),
+        pred_contribs=True
+    )
+    
+    # Select every row's top reasons in one compiled pass over the batch
+    top_idx, counts = select_top_reasons(rows, contribs, IS_CATEGORY_COLUMN, TOP_REASONS)
+    return [
+        (score, contribs[row, :-1], top_idx[row, :counts[row]])
+        for row, score in enumerate(scores.tolist())
+    ]
+
+
+def predict_prices(rows: np.ndarray) -> List[float]:
+    """
+    Predict project prices for a batch of encoded rows.
+    """
+    return price_session.run(None, {price_session.get_inputs()[0].name: rows})[0].ravel().tolist()
+
+
+# Number of uvicorn worker processes serving the API. The start-service scripts
+# run one per core and export the count; each process loads its own models.
+# Invalid or non-positive values are treated as 1 when sizing the pool below.
 try:
-    explainer: shap.TreeExplainer = shap.TreeExplainer(model)
-    print("✓ SHAP TreeExplainer initialized for success score model")
-except Exception as e:
-    print(f"✗ Error initializing SHAP explainer: {e}")
-    raise
+    API_WORKERS: int = max(1, int(os.environ.get("API_WORKERS", "1")))
+except ValueError:
+    logger.warning(f"✗ Invalid API_WORKERS={os.environ['API_WORKERS']!r}, assuming 1")
+    API_WORKERS = 1
+
+# Bounded pool for the CPU-bound model calls. Each call is pinned to one thread
+# (see the session options and warm-up above), so the cores are split between
+# the worker processes to avoid oversubscription. XGBoost, ONNX Runtime and the
+# reason selector release the GIL, so a process's threads run in parallel.
+prediction_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+    max_workers=max(1, (os.cpu_count() or 1) // API_WORKERS),
+    thread_name_prefix="xgb-predict"
+)
+
+score_batcher: PredictionBatcher = PredictionBatcher(predict_scores, prediction_executor)
+price_batcher: PredictionBatcher = PredictionBatcher(predict_prices, prediction_executor)
 
-print("="*80)
-print("✓ API initialization complete")
-print("="*80 + "\n")
+# Run the scoring path once so the reason selector is compiled (or loaded from
+# the on-disk cache) before the first request
+predict_scores(warmup_row)
 
 # ============================================================================
-# STEP 4: Initialize FastAPI Application
+# STEP 7: Initialize FastAPI Application
 # ============================================================================
 
+class OrjsonResponse(JSONResponse):
+    """
+    JSON response rendered with orjson instead of the stdlib json module.
+    
+    Endpoints return instances directly, which also skips FastAPI's
+    jsonable_encoder walk over the payload.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Start the prediction batchers with the server and stop them on shutdown.
+    """
+    score_batcher.start()
+    price_batcher.start()
+    yield
+    await score_batcher.stop()
+    await price_batcher.stop()
+
+
 app: FastAPI = FastAPI(
     title="VeriFund Creator Scoring & Pricing API",
     description="API for predicting creator project success scores and suggesting project prices with explainable AI",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=OrjsonResponse,
+    lifespan=lifespan
 )
 
 # ============================================================================
-# STEP 5: Create Root Endpoint for Health Check
+# STEP 8: Create Root Endpoint for Health Check
 # ============================================================================
 
 @app.get("/")
@@ -141,11 +518,11 @@ def read_root() -> Dict[str, str | Dict[str, str]]:
     }
 
 # ============================================================================
-# STEP 6: Create the /score POST Endpoint
+# STEP 9: Create the /score POST Endpoint
 # ============================================================================
 
 @app.post("/score")
-def score_creator(creator: CreatorData) -> dict:
+async def score_creator(creator: CreatorData) -> OrjsonResponse:
     """
     Score a creator based on their performance metrics and provide explanations.
     
@@ -153,109 +530,79 @@ def score_creator(creator: CreatorData) -> dict:
         creator (CreatorData): Creator's performance data
         
     Returns:
-        dict: JSON response containing the project success score and top reasons
+        OrjsonResponse: JSON response containing the project success score and top reasons
     """
     try:
         # ----------------------------------------------------------------
-        # Step 6a: Convert Pydantic object to DataFrame
-        # ----------------------------------------------------------------
-        input_dict: Dict = creator.dict()
-        df: pd.DataFrame = pd.DataFrame([input_dict])
-        
-        print(f"\n[Request] Scoring creator with category: {creator.project_category}")
-        
-        # ----------------------------------------------------------------
-        # Step 6b: Apply one-hot encoding (same as training)
-        # ----------------------------------------------------------------
-        # One-hot encode the project_category column
-        df = pd.get_dummies(df, columns=['project_category'], drop_first=False)
-        
-        # ----------------------------------------------------------------
-        # Step 6c: Reindex to match training columns exactly
+        # Step 9a: Encode the creator into the training feature layout
         # ----------------------------------------------------------------
-        # This ensures the DataFrame has the exact same columns in the exact
-        # same order as the training data, filling missing categories with 0
-        df = df.reindex(columns=TRAINING_COLUMNS, fill_value=0)
+        logger.debug("[Request] Scoring creator with category: %s", creator.project_category)
         
-        print(f"[Processing] Data transformed to {df.shape[1]} features")
-        
-        # ----------------------------------------------------------------
-        # Step 6d: Make prediction using the loaded model
-        # ----------------------------------------------------------------
-        prediction: np.ndarray = model.predict(df)
-        project_success_score: float = float(prediction[0])  # Extract single score
+        x: np.ndarray = build_feature_vector(creator)
         
-        print(f"[Prediction] Score: {project_success_score:.2f}")
+        logger.debug("[Processing] Data transformed to %d features", x.shape[1])
         
         # ----------------------------------------------------------------
-        # Step 6e: Calculate SHAP explanations
+        # Step 9b: Predict score, SHAP explanations and top reasons in a shared batch
         # ----------------------------------------------------------------
-        # Calculate SHAP values for this single prediction
-        shap_values: np.ndarray = explainer.shap_values(df)
+        # Concurrent requests are stacked into one booster call by score_batcher
+        project_success_score, shap_values, top_idx = await score_batcher.predict(x)
         
-        # If shap_values is 2D (single row), extract the first row
-        if len(shap_values.shape) == 2:
-            shap_values = shap_values[0]
+        logger.debug("[Prediction] Score: %.2f", project_success_score)
         
         # ----------------------------------------------------------------
-        # Step 6f: Format SHAP output into user-friendly reasons
+        # Step 9c: Format SHAP output into user-friendly reasons
         # ----------------------------------------------------------------
-        # Create a list of features with their values and SHAP impacts
-        feature_impacts: List[Dict] = []
-        
-        for idx, col in enumerate(TRAINING_COLUMNS):
-            feature_value: float = df[col].values[0]
-            shap_impact: float = float(shap_values[idx])
+        # Build reason dicts only for the features selected in the batch
+        top_reasons: List[Dict] = []
+        for idx in top_idx:
+            col: str = TRAINING_COLUMNS[idx]
+            shap_impact: float = round(float(shap_values[idx]), 2)
             
-            # Only include features with non-zero values or significant impact
-            if feature_value != 0 or abs(shap_impact) > 0.01:
-                # Format feature name for better readability
-                if col.startswith('project_category_'):
-                    if feature_value == 1:  # Only show the active category
-                        feature_name: str = col.replace('project_category_', '')
-                        feature_impacts.append({
-                            "feature": "project_category",
-                            "value": feature_name,
-                            "impact": round(shap_impact, 2)
-                        })
-                else:
-                    feature_impacts.append({
-                        "feature": col,
-                        "value": round(feature_value, 2),
-                        "impact": round(shap_impact, 2)
-                    })
-        
-        # Sort by absolute impact (most impactful features first)
-        feature_impacts.sort(key=lambda x: abs(x["impact"]), reverse=True)
-        
-        # Get top 5 most impactful reasons
-        top_reasons: List[Dict] = feature_impacts[:5]
+            # Format feature name for better readability
+            if IS_CATEGORY_COLUMN[idx]:
+                top_reasons.append({
+                    "feature": "project_category",
+                    "value": col.replace('project_category_', ''),
+                    "impact": shap_impact
+                })
+            else:
+                # Report the submitted value, not its float32 encoding. Integer
+                # fields stay int; floats use NumPy's rounding, as the original
+                # DataFrame-based code did (e.g. 0.855 -> 0.86)
+                feature_value = getattr(creator, col)
+                top_reasons.append({
+                    "feature": col,
+                    "value": feature_value if isinstance(feature_value, int)
+                             else float(np.round(feature_value, 2)),
+                    "impact": shap_impact
+                })
         
-        print(f"[Explainability] Generated {len(top_reasons)} explanations")
+        logger.debug("[Explainability] Generated %d explanations", len(top_reasons))
         
         # ----------------------------------------------------------------
-        # Step 6g: Return formatted JSON response
+        # Step 9d: Return formatted JSON response
         # ----------------------------------------------------------------
         response: dict = {
             "projectSuccessScore": round(project_success_score, 2),
             "reasons": top_reasons
         }
         
-        return response
+        return OrjsonResponse(response)
         
     except Exception as e:
-        print(f"[Error] {str(e)}")
+        logger.error("[Error] %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error processing request: {str(e)}"
         )
 
 # ============================================================================
-# STEP 7: Create the /suggest-price POST Endpoint (Pricing Co-Pilot)
+# STEP 10: Create the /suggest-price POST Endpoint (Pricing Co-Pilot)
 # ============================================================================
 
 @app.post("/suggest-price")
-def suggest_price(creator: CreatorData) -> dict:
+async def suggest_price(creator: CreatorData) -> OrjsonResponse:
     """
     Suggest a project price for a creator based on their performance metrics.
     
@@ -263,72 +610,56 @@ def suggest_price(creator: CreatorData) -> dict:
         creator (CreatorData): Creator's performance data
         
     Returns:
-        dict: JSON response containing suggested price and price range in INR
+        OrjsonResponse: JSON response containing suggested price and price range in INR
     """
     try:
         # ----------------------------------------------------------------
-        # Step 7a: Convert Pydantic object to DataFrame
+        # Step 10a: Encode the creator into the training feature layout
         # ----------------------------------------------------------------
-        input_dict: Dict = creator.dict()
-        df: pd.DataFrame = pd.DataFrame([input_dict])
+        logger.debug("[Request] Pricing suggestion for creator with category: %s", creator.project_category)
         
-        print(f"\n[Request] Pricing suggestion for creator with category: {creator.project_category}")
+        x: np.ndarray = build_feature_vector(creator)
         
-        # ----------------------------------------------------------------
-        # Step 7b: Apply one-hot encoding (same as training)
-        # ----------------------------------------------------------------
-        # One-hot encode the project_category column
-        df = pd.get_dummies(df, columns=['project_category'], drop_first=False)
+        logger.debug("[Processing] Data transformed to %d features for pricing", x.shape[1])
         
         # ----------------------------------------------------------------
-        # Step 7c: Reindex to match training columns exactly
+        # Step 10b: Make price prediction using the pricing model
         # ----------------------------------------------------------------
-        # This ensures the DataFrame has the exact same columns in the exact
-        # same order as the training data, filling missing categories with 0
-        df = df.reindex(columns=TRAINING_COLUMNS, fill_value=0)
+        # Concurrent requests are stacked into one booster call by price_batcher
+        price_prediction: float = await price_batcher.predict(x)
+        suggested_price: int = round(price_prediction)  # Round to integer
         
-        print(f"[Processing] Data transformed to {df.shape[1]} features for pricing")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[Prediction] Suggested Price: ₹{suggested_price:,}")
         
         # ----------------------------------------------------------------
-        # Step 7d: Make price prediction using the pricing model
+        # Step 10c: Calculate price range (±12% for realistic variance)
         # ----------------------------------------------------------------
-        price_prediction: np.ndarray = price_model.predict(df)
-        suggested_price: int = int(round(price_prediction[0]))  # Extract and round to integer
-        
-        print(f"[Prediction] Suggested Price: ₹{suggested_price:,}")
-        
-        # ----------------------------------------------------------------
-        # Step 7e: Calculate price range (±12% for realistic variance)
-        # ----------------------------------------------------------------
-        price_variance_percent: float = 0.12  # 12% variance
-        lower_bound: int = int(round(suggested_price * (1 - price_variance_percent)))
-        upper_bound: int = int(round(suggested_price * (1 + price_variance_percent)))
-        
-        # Ensure range stays within realistic bounds (50k to 500k)
-        lower_bound = max(50000, lower_bound)
-        upper_bound = min(500000, upper_bound)
+        lower_bound: int = max(MIN_PRICE_INR, round(suggested_price * PRICE_LOW_MULTIPLIER))
+        upper_bound: int = min(MAX_PRICE_INR, round(suggested_price * PRICE_HIGH_MULTIPLIER))
         
-        print(f"[Price Range] ₹{lower_bound:,} - ₹{upper_bound:,}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[Price Range] ₹{lower_bound:,} - ₹{upper_bound:,}")
         
         # ----------------------------------------------------------------
-        # Step 7f: Return formatted JSON response
+        # Step 10d: Return formatted JSON response
         # ----------------------------------------------------------------
         response: dict = {
             "suggested_price": suggested_price,
             "price_range": [lower_bound, upper_bound]
         }
         
-        return response
+        return OrjsonResponse(response)
         
     except Exception as e:
-        print(f"[Error] {str(e)}")
+        logger.error("[Error] %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error processing pricing request: {str(e)}"
         )
 
 # ============================================================================
-# STEP 8: Add Uvicorn Runner for Local Development
+# STEP 11: Add Uvicorn Runner for Local Development
 # ============================================================================
 
 if __name__ == "__main__":
@@ -337,16 +668,21 @@ if __name__ == "__main__":
     Access the API at: http://127.0.0.1:8000
     Interactive docs at: http://127.0.0.1:8000/docs
     """
-    print("\n" + "="*80)
-    print("Starting VeriFund API Server...")
-    print("="*80)
-    print("API will be available at: http://127.0.0.1:8000")
-    print("Interactive docs at: http://127.0.0.1:8000/docs")
-    print("="*80 + "\n")
+    logger.info("\n" + "="*80)
+    logger.info("Starting VeriFund API Server...")
+    logger.info("="*80)
+    logger.info("API will be available at: http://127.0.0.1:8000")
+    logger.info("Interactive docs at: http://127.0.0.1:8000/docs")
+    logger.info("="*80 + "\n")
     
+    # Single process for local development; start-service.sh/.bat run one
+    # worker per core. "auto" picks uvloop/httptools when they are installed
+    # (uvicorn[standard]) and falls back to asyncio/h11 otherwise.
     uvicorn.run(
         app,
         host="0.0.0.0",
         port=8000,
-        log_level="info"
+        loop="auto",
+        http="auto",
+        log_level="warning"  # Keep uvicorn's per-request access log off the hot path
     )
@@ -16,8 +16,8 @@ if errorlevel 1 (
 )
 
 REM Check if model file exists
-if not exist "verifund_model.joblib" (
-    echo Error: Model file 'verifund_model.joblib' not found
+if not exist "verifund_model.onnx" (
+    echo Error: Model file 'verifund_model.onnx' not found
     echo Please ensure the model is trained first (run train.py)
     exit /b 1
 )
@@ -48,5 +48,7 @@ echo   [OK] No deprecation warnings
 echo ================================================================
 echo.
 
-REM Start the service
-python main.py
+REM Start the service: one uvicorn worker process per core. "auto" uses
+REM httptools when installed (uvloop is not available on Windows)
+if not defined API_WORKERS set API_WORKERS=%NUMBER_OF_PROCESSORS%
+python -m uvicorn main:app --host 0.0.0.0 --port 8000 --workers %API_WORKERS% --loop auto --http auto --log-level warning
@@ -17,8 +17,8 @@ if ! command -v python &> /dev/null; then
 fi
 
 # Check if required files exist
-if [ ! -f "verifund_model.joblib" ]; then
-    echo "Error: Model file 'verifund_model.joblib' not found"
+if [ ! -f "verifund_model.onnx" ]; then
+    echo "Error: Model file 'verifund_model.onnx' not found"
     echo "Please ensure the model is trained first (run train.py)"
     exit 1
 fi
@@ -53,5 +53,8 @@ echo "  ✓ No deprecation warnings"
 echo "================================================================"
 echo ""
 
-# Start the service
-python main.py
+# Start the service: one uvicorn worker process per core. "auto" uses uvloop +
+# httptools when installed (not available under Windows Git Bash).
+export API_WORKERS="${API_WORKERS:-$(getconf _NPROCESSORS_ONLN 2>/dev/null || echo 1)}"
+python -m uvicorn main:app --host 0.0.0.0 --port 8000 --workers "$API_WORKERS" \
+    --loop auto --http auto --log-level warning
@@ -7,13 +7,16 @@ import json
 # API endpoint
 API_URL = "http://127.0.0.1:8000"
 
+# Shared session so every request reuses one keep-alive connection
+session = requests.Session()
+
 def test_health():
     """Test the health endpoint"""
     print("\n" + "="*60)
     print("Testing /health endpoint...")
     print("="*60)
     try:
-        response = requests.get(f"{API_URL}/health")
+        response = session.get(f"{API_URL}/health")
         print(f"Status Code: {response.status_code}")
         print(f"Response: {json.dumps(response.json(), indent=2)}")
         return response.status_code == 200
@@ -42,7 +45,7 @@ def test_score():
     print(f"Request Data: {json.dumps(test_data, indent=2)}")
     
     try:
-        response = requests.post(f"{API_URL}/score", json=test_data)
+        response = session.post(f"{API_URL}/score", json=test_data)
         print(f"\nStatus Code: {response.status_code}")
         print(f"Response: {json.dumps(response.json(), indent=2)}")
         return response.status_code == 200
@@ -57,7 +60,7 @@ if __name__ == "__main__":
     
     # Check if server is running
     try:
-        requests.get(API_URL, timeout=2)
+        session.get(API_URL, timeout=2)
     except:
         print("\n⚠️  Warning: AI service doesn't appear to be running!")
         print("Please start it with: python main.py")
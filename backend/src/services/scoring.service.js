@@ -1,7 +1,12 @@
 const axios = require('axios');
+const http = require('http');
+const https = require('https');
 const { v4: uuidv4 } = require('uuid');
 const Project = require('../models/Project.model');
 
+// Only pushes to these branches trigger a re-score from the GitHub webhook
+const RESCORE_BRANCH_REFS = new Set(['refs/heads/main', 'refs/heads/master']);
+
 /**
  * Scoring Service
  * Connects to Python FastAPI for AI-powered project scoring
@@ -15,12 +20,16 @@ class ScoringService {
     this.pythonApiUrl = process.env.PYTHON_API_URL || 'http://localhost:8000';
     
     // Axios instance with timeout
+    // Keep-alive agents reuse TCP connections to the Python API across scoring
+    // requests instead of opening a new connection per call
     this.axiosInstance = axios.create({
       baseURL: this.pythonApiUrl,
       timeout: 60000, // 60 seconds
       headers: {
         'Content-Type': 'application/json'
-      }
+      },
+      httpAgent: new http.Agent({ keepAlive: true, maxSockets: 32 }),
+      httpsAgent: new https.Agent({ keepAlive: true, maxSockets: 32 })
     });
   }
 
@@ -368,6 +377,23 @@ class ScoringService {
    */
   async triggerRescoreFromWebhook(payload) {
     try {
+      // Ignore pushes to other branches and tags, and branch deletions (no
+      // head commit), before any project lookup or scoring work
+      if (payload.ref && !RESCORE_BRANCH_REFS.has(payload.ref)) {
+        return {
+          success: true,
+          skipped: true,
+          message: `Ignored push to non-main ref: ${payload.ref}`
+        };
+      }
+      if (payload.head_commit === null) {
+        return {
+          success: true,
+          skipped: true,
+          message: 'Ignored push without a head commit'
+        };
+      }
+
       console.log('Processing GitHub webhook for re-scoring...');
       
       // Extract project ID from various webhook payload sources